@@ -12,6 +12,35 @@ import datetime
 # varVAMP
 from varvamp.scripts import config
 
+# open log file handle, shared by all logging calls
+_log_fh = None
+
+
+def get_log_handle(log_file, mode='a'):
+    """
+    return the cached log file handle, (re)open it if
+    necessary. mode 'w' always starts a new log.
+    """
+    global _log_fh
+
+    if _log_fh is None or _log_fh.closed or _log_fh.name != log_file or mode == 'w':
+        if _log_fh is not None and not _log_fh.closed:
+            _log_fh.close()
+        _log_fh = open(log_file, mode, buffering=1)
+
+    return _log_fh
+
+
+def close_log():
+    """
+    close the cached log file handle
+    """
+    global _log_fh
+
+    if _log_fh is not None and not _log_fh.closed:
+        _log_fh.close()
+    _log_fh = None
+
 
 def create_dir_structure(dir):
     """
@@ -20,12 +49,13 @@ def create_dir_structure(dir):
     cwd = os.getcwd()
     results_dir = os.path.join(cwd, dir)
     data_dir = os.path.join(results_dir, "data/")
-    # create folders
-    if not os.path.exists(results_dir):
-        os.makedirs(results_dir)
-    else:
-        shutil.rmtree(results_dir)
-        os.makedirs(results_dir)
+    # create folders, clean up results of previous runs
+    os.makedirs(results_dir, exist_ok=True)
+    if os.path.isdir(data_dir):
+        shutil.rmtree(data_dir)
+    for entry in os.scandir(results_dir):
+        if entry.is_file() or entry.is_symlink():
+            os.remove(entry.path)
     os.makedirs(data_dir)
 
     log_file = os.path.join(results_dir, "varvamp_log.txt")
@@ -45,22 +75,26 @@ def varvamp_progress(log_file, start_time=None, progress=0, job="", progress_tex
             "\nStarting \033[31m\033[1mvarVAMP ◥(ºwº)◤\033[0m primer design\n",
             flush=True
         )
-        with open(log_file, 'w') as f:
-            f.write('VARVAMP log \n\n')
+        get_log_handle(log_file, 'w').write("VARVAMP log \n\n")
     else:
         if progress == 1:
             stop_time = str(round(time.process_time() - start_time, 2))
             progress_text = f"all done \n\n\rvarVAMP finished in {stop_time} sec!\n{datetime.datetime.now()}"
             job = "Finalizing output."
         print(
-            "\rJob:\t\t " + job + "\nProgress: \t [{0}] {1}%".format("█"*block + "-"*(barLength-block), progress*100) + "\t" + progress_text,
+            "\rJob:\t\t {0}\nProgress: \t [{1}] {2}%\t{3}".format(
+                job,
+                "█"*block + "-"*(barLength-block),
+                progress*100,
+                progress_text
+            ),
             flush=True
         )
-        with open(log_file, 'a') as f:
-            print(
-                f"\rJob:\t {job} \nResult:\t {progress_text}",
-                file=f
-            )
+        get_log_handle(log_file).write(
+            "\rJob:\t {0} \nResult:\t {1}\n".format(job, progress_text)
+        )
+        if progress == 1:
+            close_log()
 
 
 def raise_error(message, log_file, exit=False):
@@ -68,13 +102,14 @@ def raise_error(message, log_file, exit=False):
     raises warnings or errors, writes to log
     """
     # print to log
-    with open(log_file, 'a') as f:
-        if exit:
-            print(f"ERROR: {message}", file=f)
-        else:
-            print(f"WARNING: {message}", file=f)
+    f = get_log_handle(log_file)
+    if exit:
+        f.write(f"ERROR: {message}\n")
+    else:
+        f.write(f"WARNING: {message}\n")
     # print to console
     if exit:
+        close_log()
         sys.exit(f"\n\033[31m\033[1mERROR:\033[0m {message}")
     else:
         print(f"\033[31m\033[1mWARNING:\033[0m {message}")
@@ -318,38 +353,38 @@ def confirm_config(args, log_file):
 
     # write all settings to file
     var_dic = vars(config)
-    with open(log_file, 'a') as f:
+    f = get_log_handle(log_file)
+    print(
+        f"MODE = {args.mode}",
+        sep="\n",
+        file=f
+    )
+    print(
+        "\nsettings that can be adjusted via arguments\n",
+        f"OPT_LENGTH = {args.opt_length}",
+        f"MAX_LENGTH = {args.max_length}",
+        f"THRESHOLD = {args.threshold}",
+        f"ALLOWED_N_AMB = {args.n_ambig}",
+        sep="\n",
+        file=f
+    )
+    if args.mode == "TILED":
         print(
-            f"MODE = {args.mode}",
+            f"MIN_OVERLAP = {args.overlap}",
             sep="\n",
             file=f
         )
+    if args.mode == "SANGER":
         print(
-            "\nsettings that can be adjusted via arguments\n",
-            f"OPT_LENGTH = {args.opt_length}",
-            f"MAX_LENGTH = {args.max_length}",
-            f"THRESHOLD = {args.threshold}",
-            f"ALLOWED_N_AMB = {args.n_ambig}",
+            f"REPORT_N_AMPLICONS = {args.report_n}",
             sep="\n",
             file=f
         )
-        if args.mode == "TILED":
-            print(
-                f"MIN_OVERLAP = {args.overlap}",
-                sep="\n",
-                file=f
-            )
-        if args.mode == "SANGER":
-            print(
-                f"REPORT_N_AMPLICONS = {args.report_n}",
-                sep="\n",
-                file=f
-            )
-        print(
-            "\nconfig settings\n",
-            sep="\n",
-            file = f
-        )
-        for var in all_vars[5:]:
-            print(f"{var} = {var_dic[var]}", file=f)
-        print("\nprogress", file=f)
+    print(
+        "\nconfig settings\n",
+        sep="\n",
+        file = f
+    )
+    for var in all_vars[5:]:
+        print(f"{var} = {var_dic[var]}", file=f)
+    print("\nprogress", file=f)